@@ -80,9 +80,22 @@ HOUR = 3600
 DAY = HOUR * 24
 DEFAULT_STATUS_CHECK_INTERVAL = 1 * MINUTE
 DEFAULT_AUTOSTOP_CHECK_INTERVAL = 1 * MINUTE
+
+# Floor on the autostop check interval: activity can wake the check early, but never more
+# often than this, so steady traffic can't turn the check into a busy loop.
+MIN_AUTOSTOP_CHECK_INTERVAL = 10 * SECOND
+
+# Writes to the cluster config arriving within this window are coalesced into a single
+# fan-out RPC to the servlets, rather than one RPC per servlet per key.
+CLUSTER_CONFIG_UPDATE_BATCH_WINDOW = 0.02
+CLUSTER_CONFIG_UPDATE_MAX_BATCH_SIZE = 100
 INCREASED_STATUS_CHECK_INTERVAL = 1 * HOUR
 GPU_COLLECTION_INTERVAL = 5 * SECOND
 
+# The cluster servlet samples whole-machine cpu/memory utilization in the background at this
+# interval, so status requests read a cached sample instead of blocking on psutil.
+SYSTEM_COLLECTION_INTERVAL = 4 * SECOND
+
 # We collect gpu every GPU_COLLECTION_INTERVAL.
 # Meaning that in one minute we collect (MINUTE / GPU_COLLECTION_INTERVAL) gpu stats.
 # Currently, we save gpu info of the last 10 minutes or less.
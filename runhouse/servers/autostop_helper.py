@@ -3,6 +3,7 @@ import subprocess
 
 from runhouse.constants import SKY_VENV
 from runhouse.logger import get_logger
+from runhouse.utils import arun_in_thread
 
 logger = get_logger(__name__)
 
@@ -12,6 +13,9 @@ class AutostopHelper:
 
     def __init__(self):
         self._activity_registered = False
+        # The autostop setting only changes through set_autostop below, so cache it rather
+        # than shelling into the SkyPilot venv on every read.
+        self._cached_autostop_mins = None
 
     async def set_last_active_time_to_now(self):
         self._activity_registered = True
@@ -29,13 +33,24 @@ class AutostopHelper:
             stderr=subprocess.PIPE,
         ).stdout.decode("utf-8")
 
+    async def _arun_python_in_sky_venv(self, cmd: str):
+        # These helpers are awaited on the daemon's event loop, so run the blocking
+        # subprocess call in a thread to avoid stalling the loop.
+        return await arun_in_thread(self._run_python_in_sky_venv, cmd)
+
     async def get_autostop(self):
+        if self._cached_autostop_mins is not None:
+            return self._cached_autostop_mins
+
         sky_get_autostop_cmd = shlex.quote(
             "from sky.skylet.autostop_lib import get_autostop_config; "
             "print(get_autostop_config().autostop_idle_minutes)"
         )
 
-        return int(self._run_python_in_sky_venv(sky_get_autostop_cmd))
+        self._cached_autostop_mins = int(
+            await self._arun_python_in_sky_venv(sky_get_autostop_cmd)
+        )
+        return self._cached_autostop_mins
 
     async def get_last_active_time(self):
         sky_get_last_active_time_cmd = shlex.quote(
@@ -43,7 +58,7 @@ class AutostopHelper:
             "print(get_last_active_time())"
         )
 
-        return float(self._run_python_in_sky_venv(sky_get_last_active_time_cmd))
+        return float(await self._arun_python_in_sky_venv(sky_get_last_active_time_cmd))
 
     async def set_autostop(self, idle_minutes: int):
         # Filling in "cloudvmray" as the backend because it's the only backend supported by SkyPilot right now,
@@ -54,7 +69,8 @@ class AutostopHelper:
             f'set_autostop({idle_minutes}, "cloudvmray", True)'
         )
 
-        self._run_python_in_sky_venv(sky_set_autostop_cmd)
+        await self._arun_python_in_sky_venv(sky_set_autostop_cmd)
+        self._cached_autostop_mins = int(idle_minutes)
 
     async def register_activity_if_needed(self):
         sky_register_activity_cmd = shlex.quote(
@@ -64,7 +80,7 @@ class AutostopHelper:
 
         if self._activity_registered:
             logger.debug("Activity registered, updating last active time in SkyConfig")
-            self._run_python_in_sky_venv(sky_register_activity_cmd)
+            await self._arun_python_in_sky_venv(sky_register_activity_cmd)
             self._activity_registered = False
         else:
             logger.debug(
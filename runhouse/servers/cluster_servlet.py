@@ -3,38 +3,47 @@ import copy
 import datetime
 import json
 import os
+import random
 import threading
-from typing import Any, Dict, List, Optional, Set, Tuple, Union
+import time
+from collections import defaultdict, OrderedDict
+from typing import Any, Dict, List, NamedTuple, Optional, Set, Tuple, Union
 
 import httpx
 
 import psutil
 import pynvml
 import requests
+from pydantic import BaseModel
 
 import runhouse
 
 from runhouse.constants import (
+    CLUSTER_CONFIG_UPDATE_BATCH_WINDOW,
+    CLUSTER_CONFIG_UPDATE_MAX_BATCH_SIZE,
     DEFAULT_AUTOSTOP_CHECK_INTERVAL,
     DEFAULT_STATUS_CHECK_INTERVAL,
     GPU_COLLECTION_INTERVAL,
     INCREASED_STATUS_CHECK_INTERVAL,
     MAX_GPU_INFO_LEN,
+    MIN_AUTOSTOP_CHECK_INTERVAL,
     REDUCED_GPU_INFO_LEN,
     SERVER_LOGFILE,
     SERVER_LOGS_FILE_NAME,
+    SYSTEM_COLLECTION_INTERVAL,
 )
 
 from runhouse.globals import configs, obj_store, rns_client
 from runhouse.logger import get_logger
 from runhouse.resources.hardware import load_cluster_config_from_file
-from runhouse.resources.hardware.utils import is_gpu_cluster
+from runhouse.resources.hardware.utils import is_gpu_cluster, RunhouseDaemonStatus
 from runhouse.rns.rns_client import ResourceStatusData
 from runhouse.rns.utils.api import ResourceAccess
 from runhouse.servers.autostop_helper import AutostopHelper
 from runhouse.servers.http.auth import AuthCache
 from runhouse.servers.http.http_utils import CreateProcessParams
 from runhouse.utils import (
+    arun_in_thread,
     ColoredFormatter,
     get_gpu_usage,
     get_pid,
@@ -44,11 +53,71 @@ from runhouse.utils import (
 
 logger = get_logger(__name__)
 
+# ResourceStatusData's schema is fixed at class definition time, so cache the field names used
+# to build plain-dict views of a validated status.
+_STATUS_FIELDS = tuple(ResourceStatusData.model_fields)
+
 
 class ClusterServletError(Exception):
     pass
 
 
+class _TTLCache:
+    """Minimal size-bounded TTL cache. Entries expire ``ttl`` seconds after insertion, and the
+    oldest entries are evicted once ``maxsize`` is exceeded."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._cache: "OrderedDict[Any, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        entry = self._cache.get(key)
+        if entry is None:
+            return default
+
+        expiry, value = entry
+        if time.time() > expiry:
+            del self._cache[key]
+            return default
+
+        return value
+
+    def set(self, key: Any, value: Any):
+        if key in self._cache:
+            del self._cache[key]
+        elif len(self._cache) >= self._maxsize:
+            self._cache.popitem(last=False)
+
+        self._cache[key] = (time.time() + self._ttl, value)
+
+    def pop(self, key: Any, default: Any = None) -> Any:
+        entry = self._cache.pop(key, None)
+        return default if entry is None else entry[1]
+
+    def clear(self):
+        self._cache.clear()
+
+
+class DenStatusEnvelope(BaseModel):
+    """Shape of the cluster status payload posted to Den."""
+
+    daemon_status: str
+    resource_type: Optional[str] = None
+    resource_info: Dict[str, Any]
+    env_servlet_processes: Dict[str, Any]
+
+
+class _ServletStatus(NamedTuple):
+    """Result of polling a single servlet for its status. Exactly one of
+    (objects_in_servlet, utilization_data) or err is populated."""
+
+    servlet_name: str
+    objects_in_servlet: Optional[list] = None
+    utilization_data: Optional[dict] = None
+    err: Optional[BaseException] = None
+
+
 class ClusterServlet:
     async def __init__(
         self, cluster_config: Optional[Dict[str, Any]] = None, *args, **kwargs
@@ -66,14 +135,49 @@ class ClusterServlet:
 
         self._initialized_servlet_args: Dict[str, CreateProcessParams] = {}
         self._key_to_servlet_name: Dict[Any, str] = {}
+        # Reverse index of the above, so tearing down a servlet only touches its own keys
+        # rather than scanning every key on the cluster.
+        self._servlet_name_to_keys: Dict[str, Set[Any]] = defaultdict(set)
         self._auth_cache: AuthCache = AuthCache(self.cluster_config)
+
+        # Validating a cluster token requires a round trip to Den, so cache the verdict per
+        # (token, resource_uri) for a short window. Cleared in aclear_auth_cache so revocations
+        # propagate immediately.
+        self._cluster_token_cache = _TTLCache(maxsize=10_000, ttl=60)
+
+        # Tokens that have proven owner-level access to the cluster itself, so repeat requests
+        # from them short-circuit before any per-resource lookup. Entries expire on the same
+        # TTL as the validation cache above, so a revoked cluster token is revalidated with
+        # Den within a minute; also cleared in aclear_auth_cache and on cluster rename.
+        self._owner_token_cache = _TTLCache(maxsize=10_000, ttl=60)
+
+        # Bounded negative cache for "no access" verdicts, so a flood of unknown tokens
+        # (scans, retries with revoked credentials) can't drive an unbounded number of
+        # control-plane lookups. The short TTL keeps newly-granted access propagating quickly.
+        self._negative_access_cache = _TTLCache(maxsize=100_000, ttl=30)
         self.autostop_helper = None
         self._paths_to_prepend_in_new_processes = []
         self._node_servlet_names: List[str] = []
 
+        # The servlet's main event loop, which owns the config update batcher and the
+        # background tasks created below. Callers running on other loops (e.g. the periodic
+        # check threads) dispatch to it via run_coroutine_threadsafe.
+        self._main_loop = asyncio.get_running_loop()
+
+        # Batches config writes arriving within a short window into a single fan-out to
+        # the servlets.
+        self._config_update_queue: asyncio.Queue = asyncio.Queue()
+        self._config_update_task: asyncio.Task = asyncio.create_task(
+            self._config_update_loop()
+        )
+
         if cluster_config.get("resource_subtype", None) == "OnDemandCluster":
             self.autostop_helper = AutostopHelper()
 
+        # Signals the autostop loop that activity occurred, so it can register it right away
+        # instead of waiting out the rest of its check interval.
+        self._activity_event = asyncio.Event()
+
         self._cluster_name = self.cluster_config.get("name", None)
         self._cluster_uri = (
             rns_client.format_rns_address(self._cluster_name)
@@ -84,8 +188,26 @@ class ClusterServlet:
         self._api_server_url = self.cluster_config.get(
             "api_server_url", rns_client.api_server_url
         )
+
+        # Request headers for posts to Den, assembled once and reused across status and log
+        # ticks. Invalidated whenever a config change affects them.
+        self._den_headers: Optional[dict] = None
+        # Reusable HTTP clients for posting to Den, so every status tick doesn't pay for a
+        # fresh TCP/TLS handshake. httpx clients are bound to the event loop they were first
+        # used on, so keep one per loop (status posts can come from the servlet's main loop
+        # or from the sync_function background loop).
+        self._den_clients: Dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+
         self.pid = get_pid()
         self.process = psutil.Process(pid=self.pid)
+
+        # Most recent whole-machine cpu/memory sample, refreshed by the sampler task below so
+        # astatus never blocks on psutil sampling.
+        self._system_sample: Optional[Dict[str, Any]] = None
+        self._system_sample_task = asyncio.create_task(
+            self._asample_system_usage_loop()
+        )
+
         self.gpu_metrics = None  # will be updated only if this is a gpu cluster.
 
         # will be used when self.gpu_metrics will be updated by different threads.
@@ -104,11 +226,8 @@ class ClusterServlet:
         )
         self.cluster_checks_thread.start()
 
-        logger.debug("Creating autostop check thread.")
-        self.autostop_check_thread = threading.Thread(
-            target=self.periodic_autostop_check, daemon=True
-        )
-        self.autostop_check_thread.start()
+        logger.debug("Creating autostop check task.")
+        self.autostop_check_task = asyncio.create_task(self.aperiodic_autostop_check())
 
     ##############################################
     # List of node servlet names
@@ -134,11 +253,37 @@ class ClusterServlet:
     async def aget_cluster_config(self) -> Dict[str, Any]:
         return self.cluster_config
 
+    def _refresh_cluster_identity(self, changed_keys):
+        """Recompute the values derived from the cluster config (and the cached Den request
+        headers) when a config change affects them."""
+        if "name" in changed_keys:
+            self._cluster_name = self.cluster_config.get("name", None)
+            self._cluster_uri = (
+                rns_client.format_rns_address(self._cluster_name)
+                if self._cluster_name
+                else None
+            )
+            # Owner tokens are scoped to the cluster's Den address, so they don't carry over
+            self._owner_token_cache.clear()
+
+        if "api_server_url" in changed_keys:
+            self._api_server_url = self.cluster_config.get(
+                "api_server_url", rns_client.api_server_url
+            )
+
+        self._den_headers = None
+
+    def _get_den_headers(self) -> Optional[dict]:
+        if self._den_headers is None:
+            self._den_headers = rns_client.request_headers()
+        return self._den_headers
+
     async def aset_cluster_config(self, cluster_config: Dict[str, Any]):
         if "has_cuda" not in cluster_config.keys():
             cluster_config["has_cuda"] = is_gpu_cluster()
 
         self.cluster_config = cluster_config
+        self._refresh_cluster_identity({"name", "api_server_url"})
 
         # Propagate the changes to all other process's obj_stores
         await asyncio.gather(
@@ -156,18 +301,79 @@ class ClusterServlet:
         return self.cluster_config
 
     async def aset_cluster_config_value(self, key: str, value: Any):
-        if self.autostop_helper and key == "autostop_mins":
-            await self.autostop_helper.set_autostop(value)
-        self.cluster_config[key] = value
+        # Single-key writes go through the batcher, so that writes arriving close together
+        # are coalesced into one fan-out RPC per servlet instead of one per key.
+        return await self.aset_cluster_config_values({key: value})
+
+    async def aset_cluster_config_values(self, updates: Dict[str, Any]):
+        if asyncio.get_running_loop() is self._main_loop:
+            return await self._aenqueue_config_updates(updates)
+
+        # Called from a loop other than the servlet's main loop (e.g. one of the periodic
+        # check threads); dispatch to the main loop, where the batcher lives.
+        return await asyncio.wrap_future(
+            asyncio.run_coroutine_threadsafe(
+                self._aenqueue_config_updates(updates), self._main_loop
+            )
+        )
 
-        # Propagate the changes to all other process's obj_stores
+    async def _aenqueue_config_updates(self, updates: Dict[str, Any]):
+        future = self._main_loop.create_future()
+        await self._config_update_queue.put((updates, future))
+        return await future
+
+    async def _config_update_loop(self):
+        """Drain the config update queue, merging writes that arrive within a short window into
+        a single multi-key fan-out to the servlets."""
+        while True:
+            updates, future = await self._config_update_queue.get()
+            batch = [(updates, future)]
+
+            deadline = (
+                asyncio.get_running_loop().time() + CLUSTER_CONFIG_UPDATE_BATCH_WINDOW
+            )
+            while len(batch) < CLUSTER_CONFIG_UPDATE_MAX_BATCH_SIZE:
+                timeout = deadline - asyncio.get_running_loop().time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(
+                        await asyncio.wait_for(
+                            self._config_update_queue.get(), timeout=timeout
+                        )
+                    )
+                except asyncio.TimeoutError:
+                    break
+
+            merged_updates = {}
+            for updates, _ in batch:
+                merged_updates.update(updates)
+
+            try:
+                await self._apply_cluster_config_updates(merged_updates)
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+            else:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_result(self.cluster_config)
+
+    async def _apply_cluster_config_updates(self, updates: Dict[str, Any]):
+        if self.autostop_helper and "autostop_mins" in updates:
+            await self.autostop_helper.set_autostop(updates["autostop_mins"])
+            self._activity_event.set()
+        self.cluster_config.update(updates)
+        self._refresh_cluster_identity(updates.keys())
+
+        # Propagate the changes to all other process's obj_stores, all keys in one RPC
         await asyncio.gather(
             *[
                 obj_store.acall_servlet_method(
                     servlet_name,
-                    "aset_cluster_config_value",
-                    key,
-                    value,
+                    "aset_cluster_config_values",
+                    updates,
                     use_servlet_cache=False,
                 )
                 for servlet_name in await self.aget_all_initialized_servlet_args()
@@ -184,25 +390,45 @@ class ClusterServlet:
     ) -> Union[str, None]:
         # If the token in this request matches that of the owner of the cluster,
         # they have access to everything
+        if self._owner_token_cache.get(token):
+            return ResourceAccess.WRITE
+
         config_token = configs.token
         if config_token:
             if config_token == token:
                 return ResourceAccess.WRITE
 
-            if resource_uri and rns_client.validate_cluster_token(
-                cluster_token=token, cluster_uri=resource_uri
-            ):
-                return ResourceAccess.WRITE
+            if resource_uri:
+                cache_key = (token, resource_uri)
+                is_valid_cluster_token = self._cluster_token_cache.get(cache_key)
+                if is_valid_cluster_token is None:
+                    is_valid_cluster_token = rns_client.validate_cluster_token(
+                        cluster_token=token, cluster_uri=resource_uri
+                    )
+                    self._cluster_token_cache.set(cache_key, is_valid_cluster_token)
+
+                if is_valid_cluster_token:
+                    if resource_uri in (self._cluster_name, self._cluster_uri):
+                        # Valid for the cluster itself, i.e. owner-level access to every
+                        # resource on it; skip the lookups entirely on subsequent requests
+                        self._owner_token_cache.set(token, True)
+                    return ResourceAccess.WRITE
+
+        cache_key = (token, resource_uri)
+        if self._negative_access_cache.get(cache_key):
+            return None
+
+        access_level = self._auth_cache.lookup_access_level(token, resource_uri)
+        if access_level is None:
+            self._negative_access_cache.set(cache_key, True)
 
-        return self._auth_cache.lookup_access_level(token, resource_uri)
+        return access_level
 
     async def aget_username(self, token: str) -> str:
         return self._auth_cache.get_username(token)
 
     async def ahas_resource_access(self, token: str, resource_uri=None) -> bool:
         """Checks whether user has read or write access to a given module saved on the cluster."""
-        from runhouse.rns.utils.api import ResourceAccess
-
         if token is None or self._cluster_name is None:
             # If no token or cluster uri are provided assume no access
             return False
@@ -227,6 +453,12 @@ class ClusterServlet:
 
     async def aclear_auth_cache(self, token: str = None):
         self._auth_cache.clear_cache(token)
+        self._cluster_token_cache.clear()
+        self._negative_access_cache.clear()
+        if token is None:
+            self._owner_token_cache.clear()
+        else:
+            self._owner_token_cache.pop(token)
 
     ##############################################
     # Key to servlet where it is stored mapping
@@ -251,6 +483,7 @@ class ClusterServlet:
     async def aget_servlet_name_for_key(self, key: Any) -> str:
         if self.autostop_helper:
             await self.autostop_helper.set_last_active_time_to_now()
+            self._activity_event.set()
         return self._key_to_servlet_name.get(key, None)
 
     async def aput_servlet_name_for_key(self, key: Any, servlet_name: str):
@@ -258,14 +491,22 @@ class ClusterServlet:
             raise ValueError(
                 f"Env servlet name {servlet_name} not initialized, and you tried to mark a resource as in it."
             )
+        prev_servlet_name = self._key_to_servlet_name.get(key)
+        if prev_servlet_name is not None and prev_servlet_name != servlet_name:
+            self._servlet_name_to_keys[prev_servlet_name].discard(key)
         self._key_to_servlet_name[key] = servlet_name
+        self._servlet_name_to_keys[servlet_name].add(key)
 
     async def apop_servlet_name_for_key(self, key: Any, *args) -> str:
         # *args allows us to pass default or not
-        return self._key_to_servlet_name.pop(key, *args)
+        servlet_name = self._key_to_servlet_name.pop(key, *args)
+        if servlet_name in self._servlet_name_to_keys:
+            self._servlet_name_to_keys[servlet_name].discard(key)
+        return servlet_name
 
     async def aclear_key_to_servlet_name_dict(self):
         self._key_to_servlet_name = {}
+        self._servlet_name_to_keys = defaultdict(set)
 
     ##############################################
     # Remove Env Servlet
@@ -274,41 +515,51 @@ class ClusterServlet:
         # using lock to prevent status thread access self._initialized_servlet_args before the env is deleted.
         with self.lock:
             del self._initialized_servlet_args[servlet_name]
-            deleted_keys = [
-                key
-                for key, env in self._key_to_servlet_name.items()
-                if env == servlet_name
-            ]
+            deleted_keys = list(self._servlet_name_to_keys.pop(servlet_name, ()))
             for key in deleted_keys:
-                self._key_to_servlet_name.pop(key)
+                self._key_to_servlet_name.pop(key, None)
         return deleted_keys
 
     ##############################################
     # Periodic Cluster Checks APIs
     ##############################################
-    async def asave_status_metrics_to_den(self, status: dict):
-        from runhouse.resources.hardware.utils import RunhouseDaemonStatus
+    def _get_den_client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        client = self._den_clients.get(loop)
+        if client is None:
+            client = httpx.AsyncClient()
+            self._den_clients[loop] = client
+        return client
 
-        # making a copy so the status won't be modified with pop, since it will be returned after sending to den.
-        # (status is passed as pointer).
-        status_copy = copy.deepcopy(status)
-        servlet_processes = status_copy.pop("env_servlet_processes")
-
-        status_data = {
-            "daemon_status": RunhouseDaemonStatus.RUNNING,
-            "resource_type": status_copy.get("cluster_config").pop(
-                "resource_type", "cluster"
-            ),
-            "resource_info": status_copy,
-            "env_servlet_processes": servlet_processes,
+    async def asave_status_metrics_to_den(self, status: dict):
+        # Shallow copies are enough here: we only drop top-level keys from the payload, and
+        # the envelope is serialized straight to JSON without mutating the caller's status
+        # (which is returned after sending to den).
+        resource_info = {
+            k: v for k, v in status.items() if k != "env_servlet_processes"
         }
+        resource_info["cluster_config"] = {
+            k: v for k, v in status["cluster_config"].items() if k != "resource_type"
+        }
+
+        envelope = DenStatusEnvelope(
+            daemon_status=RunhouseDaemonStatus.RUNNING,
+            resource_type=status["cluster_config"].get("resource_type", "cluster"),
+            resource_info=resource_info,
+            env_servlet_processes=status["env_servlet_processes"],
+        )
 
-        client = httpx.AsyncClient()
+        # Serialize once through pydantic's native JSON dump, rather than building an
+        # intermediate dict and pushing every nested value through json.dumps
+        body = envelope.model_dump_json().encode()
 
-        return await client.post(
+        return await self._get_den_client().post(
             f"{self._api_server_url}/resource/{self._cluster_uri}/cluster/status",
-            data=json.dumps(status_data),
-            headers=rns_client.request_headers(),
+            content=body,
+            headers={
+                **(self._get_den_headers() or {}),
+                "Content-Type": "application/json",
+            },
         )
 
     def save_status_metrics_to_den(self, status: dict):
@@ -335,8 +586,8 @@ class ClusterServlet:
     async def acheck_cluster_logs(self, interval_size: int):
         logger.debug("Performing logs checks")
 
-        cluster_config = await self.aget_cluster_config()
-        prev_end_log_line = cluster_config.get("end_log_line", 0)
+        # cluster_config is a local attribute, no need to await the getter
+        prev_end_log_line = self.cluster_config.get("end_log_line", 0)
         (
             logs_den_resp,
             new_start_log_line,
@@ -351,11 +602,11 @@ class ClusterServlet:
 
         elif logs_den_resp.status_code == 200:
             logger.debug("Successfully sent cluster logs to Den")
-            await self.aset_cluster_config_value(
-                key="start_log_line", value=new_start_log_line
-            )
-            await self.aset_cluster_config_value(
-                key="end_log_line", value=new_end_log_line
+            await self.aset_cluster_config_values(
+                {
+                    "start_log_line": new_start_log_line,
+                    "end_log_line": new_end_log_line,
+                }
             )
         else:
             logger.error("Failed to send logs to Den")
@@ -380,7 +631,21 @@ class ClusterServlet:
 
             finally:
                 logger.debug(f"Autostop interval set to {autostop_interval} seconds")
-                await asyncio.sleep(autostop_interval)
+                # Always sleep a minimum gap first: an activity wake can only shave the tail
+                # of the interval, so steady traffic setting the event on every key lookup
+                # can't turn this check into a back-to-back busy loop.
+                min_gap = min(MIN_AUTOSTOP_CHECK_INTERVAL, autostop_interval)
+                await asyncio.sleep(min_gap)
+                try:
+                    # Wake as soon as activity is signaled so it's registered in SkyConfig
+                    # promptly; otherwise idle until the interval elapses
+                    await asyncio.wait_for(
+                        self._activity_event.wait(),
+                        timeout=autostop_interval - min_gap,
+                    )
+                except asyncio.TimeoutError:
+                    pass
+                self._activity_event.clear()
 
     async def aperiodic_cluster_checks(self):
         """Periodically check the status of the cluster, gather metrics about the cluster's utilization & memory,
@@ -392,6 +657,9 @@ class ClusterServlet:
             os.getenv("disable_observability", "false").strip().lower() == "true"
         )
 
+        consecutive_failures = 0
+        backoff = None
+
         while True:
             should_send_status_and_logs_to_den: bool = (
                 configs.token is not None and self._cluster_uri is not None
@@ -400,8 +668,8 @@ class ClusterServlet:
             if not should_send_status_and_logs_to_den:
                 break
 
-            cluster_config = await self.aget_cluster_config()
-            interval_size = cluster_config.get(
+            # cluster_config is a local attribute, no need to await the getter
+            interval_size = self.cluster_config.get(
                 "status_check_interval", DEFAULT_STATUS_CHECK_INTERVAL
             )
 
@@ -432,7 +700,7 @@ class ClusterServlet:
                 else:
                     logger.debug("Successfully sent cluster status to Den")
 
-                    prev_end_log_line = cluster_config.get("end_log_line", 0)
+                    prev_end_log_line = self.cluster_config.get("end_log_line", 0)
                     (
                         logs_resp_status_code,
                         new_start_log_line,
@@ -447,22 +715,32 @@ class ClusterServlet:
 
                     elif logs_resp_status_code == 200:
                         logger.debug("Successfully sent cluster logs to Den.")
-                        await self.aset_cluster_config_value(
-                            key="start_log_line", value=new_start_log_line
-                        )
-                        await self.aset_cluster_config_value(
-                            key="end_log_line", value=new_end_log_line
+                        await self.aset_cluster_config_values(
+                            {
+                                "start_log_line": new_start_log_line,
+                                "end_log_line": new_end_log_line,
+                            }
                         )
 
                 if den_resp_code == 200:
                     await self.acheck_cluster_logs(interval_size=interval_size)
 
+                consecutive_failures = 0
+                backoff = None
+
             except Exception as e:
+                # Back off exponentially (with jitter, so retries from many clusters don't
+                # synchronize) instead of jumping straight to the increased interval on a
+                # single transient failure.
+                consecutive_failures += 1
+                backoff = min(
+                    INCREASED_STATUS_CHECK_INTERVAL, (backoff or interval_size) * 2
+                ) + random.uniform(0, 5)
                 logger.error(
                     f"Cluster checks have failed: {e}.\n"
-                    "Temporarily increasing the interval between status checks."
+                    f"Retrying in {backoff:.0f} seconds "
+                    f"({consecutive_failures} consecutive failures)."
                 )
-                await asyncio.sleep(INCREASED_STATUS_CHECK_INTERVAL)
 
             finally:
                 # make sure that the thread will go to sleep, even if the interval size == -1
@@ -472,16 +750,13 @@ class ClusterServlet:
                     if interval_size == -1
                     else interval_size
                 )
-                await asyncio.sleep(interval_size)
+                await asyncio.sleep(backoff if backoff is not None else interval_size)
 
     def periodic_cluster_checks(self):
         # This is only ever called once in its own thread, so we can do asyncio.run here instead of
         # sync_function.
         asyncio.run(self.aperiodic_cluster_checks())
 
-    def periodic_autostop_check(self):
-        asyncio.run(self.aperiodic_autostop_check())
-
     async def _update_autostop(self, status: dict):
         function_running = any(
             any(
@@ -504,7 +779,7 @@ class ClusterServlet:
         # been called and completed.
         await self.autostop_helper.register_activity_if_needed()
 
-    async def _status_for_servlet(self, servlet_name):
+    async def _status_for_servlet(self, servlet_name) -> _ServletStatus:
         try:
             (
                 objects_in_servlet,
@@ -513,16 +788,16 @@ class ClusterServlet:
                 servlet_name, method="astatus_local"
             )
 
-            return {
-                "servlet_name": servlet_name,
-                "objects_in_servlet": objects_in_servlet,
-                "servlet_utilization_data": servlet_utilization_data,
-            }
+            return _ServletStatus(
+                servlet_name=servlet_name,
+                objects_in_servlet=objects_in_servlet,
+                utilization_data=servlet_utilization_data,
+            )
 
         # Need to catch the exception here because we're running this in a gather,
         # and need to know which env servlet failed
         except Exception as e:
-            return {"servlet_name": servlet_name, "Exception": e}
+            return _ServletStatus(servlet_name=servlet_name, err=e)
 
     async def _aperiodic_gpu_check(self):
         """periodically collects cluster gpu usage"""
@@ -578,6 +853,39 @@ class ClusterServlet:
         # This is only ever called once in its own thread, so we can do asyncio.run here instead of `sync_function`.
         asyncio.run(self._aperiodic_gpu_check())
 
+    async def _asample_system_usage_loop(self):
+        """Periodically sample whole-machine cpu and memory utilization, so status requests read
+        the cached sample instead of blocking on psutil."""
+        while True:
+            try:
+                # cpu_percent blocks for the duration of its sampling interval, so take it in
+                # a thread (a 1s interval also gives a much more meaningful reading than an
+                # instantaneous one).
+                cpu_percent = await arun_in_thread(psutil.cpu_percent, 1)
+                self._system_sample = {
+                    "cpu_percent": cpu_percent,
+                    "virtual_memory": psutil.virtual_memory()._asdict(),
+                }
+            except Exception as e:
+                logger.error(f"Failed to sample system utilization: {e}")
+
+            await asyncio.sleep(SYSTEM_COLLECTION_INTERVAL)
+
+    def _get_system_usage(self) -> Dict[str, Any]:
+        # Fall back to an instantaneous sample if the sampler task hasn't produced one yet.
+        return self._system_sample or {
+            "cpu_percent": psutil.cpu_percent(interval=0),
+            "virtual_memory": psutil.virtual_memory()._asdict(),
+        }
+
+    async def _aget_system_usage(self) -> Dict[str, Any]:
+        if self._system_sample:
+            return self._system_sample
+
+        # The sampler task hasn't produced a sample yet; take the fallback sample in a
+        # thread so it can overlap with the servlet status gather in astatus.
+        return await arun_in_thread(self._get_system_usage)
+
     def _get_node_gpu_usage(self, server_pid: int):
         # TODO [SB] currently works correctly for a single node GPU. Multinode-clusters will be supported shortly.
         collected_gpus_info = copy.deepcopy(self.gpu_metrics)
@@ -595,43 +903,49 @@ class ClusterServlet:
         return cluster_gpu_usage
 
     async def astatus(self, send_to_den: bool = False) -> Tuple[Dict, Optional[int]]:
-        config_cluster = copy.deepcopy(self.cluster_config)
-
-        # Popping out creds because we don't want to show them in the status
-        config_cluster.pop("creds", None)
+        # Skipping creds because we don't want to show them in the status. A shallow copy is
+        # enough here since the status payload only reads the config; no need to deepcopy the
+        # whole nested config just to drop one key.
+        config_cluster = {k: v for k, v in self.cluster_config.items() if k != "creds"}
 
-        # Getting data from each env servlet about the objects it contains and the utilization data
+        # Getting data from each env servlet about the objects it contains and the utilization
+        # data, overlapped with the system utilization read since the two are independent
         servlet_utilization_data = {}
         with self.lock:
-            servlets_status = await asyncio.gather(
-                *[
-                    self._status_for_servlet(servlet_name)
-                    for servlet_name in await self.aget_all_initialized_servlet_args()
-                ],
+            servlets_status, system_usage = await asyncio.gather(
+                asyncio.gather(
+                    *[
+                        self._status_for_servlet(servlet_name)
+                        for servlet_name in await self.aget_all_initialized_servlet_args()
+                    ],
+                ),
+                self._aget_system_usage(),
             )
 
         # Store the data for the appropriate env servlet name
         for env_status in servlets_status:
-            servlet_name = env_status.get("servlet_name")
+            if isinstance(env_status, BaseException):
+                # _status_for_servlet catches its own exceptions, but don't let a raw one
+                # slipping through the gather take down the whole status call
+                env_status = _ServletStatus(servlet_name="<unknown>", err=env_status)
+
+            servlet_name = env_status.servlet_name
 
             # Nothing to store if there was an exception
-            if "Exception" in env_status.keys():
-                e = env_status.get("Exception")
+            if env_status.err is not None:
                 logger.warning(
-                    f"Exception {str(e)} in status for env servlet {servlet_name}"
+                    f"Exception {str(env_status.err)} in status for env servlet {servlet_name}"
                 )
                 servlet_utilization_data[servlet_name] = {}
 
             else:
                 # Store what was in the env and the utilization data
-                env_memory_info = env_status.get("servlet_utilization_data")
-                env_memory_info["env_resource_mapping"] = env_status.get(
-                    "objects_in_servlet"
-                )
+                env_memory_info = env_status.utilization_data
+                env_memory_info["env_resource_mapping"] = env_status.objects_in_servlet
                 servlet_utilization_data[servlet_name] = env_memory_info
 
         # TODO: decide if we need this info at all: cpu_usage, memory_usage, disk_usage
-        cpu_utilization = psutil.cpu_percent(interval=0)
+        cpu_utilization = system_usage["cpu_percent"]
 
         # A dictionary that match the keys of psutil.virtual_memory()._asdict() to match the keys we expect in Den.
         relevant_memory_info = {
@@ -643,7 +957,7 @@ class ClusterServlet:
 
         # Fields: `total`, `available`, `percent`, `used`, `free`, `active`, `inactive`, `buffers`, `cached`, `shared`, `slab`
         # according to psutil docs, percent = (total - available) / total * 100
-        memory_usage = psutil.virtual_memory()._asdict()
+        memory_usage = system_usage["virtual_memory"]
 
         memory_usage = {
             relevant_memory_info[k]: memory_usage[k]
@@ -679,8 +993,11 @@ class ClusterServlet:
             "server_gpu_usage": server_gpu_usage,
         }
 
-        # converting status_data to ResourceStatusData instance to verify we constructed the status data correctly
-        status_data = ResourceStatusData(**status_data).model_dump()
+        # converting status_data to ResourceStatusData instance to verify we constructed the status data correctly.
+        # The plain dict is then rebuilt by direct attribute access over the cached field names -
+        # unlike model_dump, this doesn't deep-copy every nested value on each status call.
+        status_model = ResourceStatusData(**status_data)
+        status_data = {f: getattr(status_model, f) for f in _STATUS_FIELDS}
 
         if send_to_den:
             logger.debug("Sending cluster status to Den")
@@ -731,10 +1048,14 @@ class ClusterServlet:
             "end_line": new_end_log_line,
         }
 
+        # Pre-encode to bytes so requests writes the buffer straight to the socket
         post_logs_resp = requests.post(
             f"{self._api_server_url}/resource/{self._cluster_uri}/logs",
-            data=json.dumps(logs_data),
-            headers=rns_client.request_headers(),
+            data=json.dumps(logs_data).encode(),
+            headers={
+                **(self._get_den_headers() or {}),
+                "Content-Type": "application/json",
+            },
         )
 
         resp_status_code = post_logs_resp.status_code
@@ -675,6 +675,14 @@ class ObjStore:
     def set_cluster_config_value(self, key: str, value: Any):
         sync_function(self.aset_cluster_config_value)(key, value)
 
+    async def aset_cluster_config_values(self, updates: Dict[str, Any]):
+        self.cluster_config = await self.acall_actor_method(
+            self.cluster_servlet, "aset_cluster_config_values", updates
+        )
+
+    def set_cluster_config_values(self, updates: Dict[str, Any]):
+        sync_function(self.aset_cluster_config_values)(updates)
+
     ##############################################
     # Auth cache internal functions
     ##############################################
@@ -154,6 +154,9 @@ class Servlet:
     async def aset_cluster_config_value(self, key: str, value: Any):
         obj_store.cluster_config[key] = value
 
+    async def aset_cluster_config_values(self, updates: Dict[str, Any]):
+        obj_store.cluster_config.update(updates)
+
     ##############################################################
     # Methods decorated with a standardized error decorating handler
     # These catch exceptions and wrap the output in a Response object.
@@ -14,6 +14,7 @@ import subprocess
 import sys
 import tempfile
 import threading
+import weakref
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from enum import Enum
@@ -238,20 +239,30 @@ def run_with_logs(cmd: str, **kwargs):
 ####################################################################################################
 
 
-def _find_directory_containing_any_file(dir_path, files, searched_dirs=None):
-    if Path(dir_path) == Path.home() or dir_path == Path("/"):
-        return None
-
-    if any(Path(dir_path, file).exists() for file in files):
-        return str(dir_path)
+def _find_directory_containing_any_file(dir_path, files):
+    # Walk up the tree iteratively, listing each directory once with scandir and intersecting
+    # with the target names, rather than issuing a stat per candidate file per level.
+    targets = set(files)
+    current = Path(dir_path)
+    while True:
+        if current == Path.home() or current == Path("/"):
+            return None
 
-    searched_dirs.add(dir_path)
-    parent_path = Path(dir_path).parent
-    if parent_path in searched_dirs:
-        return None
-    return _find_directory_containing_any_file(
-        parent_path, files, searched_dirs=searched_dirs
-    )
+        try:
+            with os.scandir(current) as entries:
+                names = {entry.name for entry in entries}
+        except OSError:
+            # The start dir may not exist (yet); keep walking up towards directories that do
+            names = set()
+
+        if targets & names:
+            return str(current)
+
+        parent = current.parent
+        if parent == current:
+            # Reached the filesystem root
+            return None
+        current = parent
 
 
 def locate_working_dir(start_dir=None):
@@ -259,27 +270,61 @@ def locate_working_dir(start_dir=None):
         start_dir = os.getcwd()
 
     # Search first for anything that represents a Python package
-    target_files = [
+    target_files = (
         ".git",
         "setup.py",
         "setup.cfg",
         "pyproject.toml",
         "requirements.txt",
-    ]
-
-    dir_with_target = _find_directory_containing_any_file(
-        start_dir, target_files, searched_dirs=set()
     )
 
+    dir_with_target = _find_directory_containing_any_file(start_dir, target_files)
+
     if dir_with_target is None:
-        dir_with_target = _find_directory_containing_any_file(
-            start_dir, ["rh"], searched_dirs=set()
-        )
+        dir_with_target = _find_directory_containing_any_file(start_dir, ("rh",))
 
     return dir_with_target if dir_with_target is not None else start_dir
 
 
+# Module and import info is deterministic for a given function or class object, and the same
+# handful of callables get resolved over and over during dispatch, so memoize the inspect and
+# os.path work by object id. A weakref finalizer evicts an entry when its object is collected,
+# so a reused id can never serve a stale result.
+_module_info_cache: Dict[int, tuple] = {}
+_module_path_cache: Dict[int, Optional[str]] = {}
+_module_cache_refs: Dict[int, "weakref.ref"] = {}
+
+
+def _evict_module_caches(obj_id, _ref=None):
+    _module_info_cache.pop(obj_id, None)
+    _module_path_cache.pop(obj_id, None)
+    _module_cache_refs.pop(obj_id, None)
+
+
+def _store_in_module_cache(cache: dict, obj, value):
+    obj_id = id(obj)
+    if obj_id not in _module_cache_refs:
+        try:
+            _module_cache_refs[obj_id] = weakref.ref(
+                obj, functools.partial(_evict_module_caches, obj_id)
+            )
+        except TypeError:
+            # Not weakref-able (e.g. some builtins), so we can't track its lifetime safely
+            return
+    cache[obj_id] = value
+
+
+def clear_module_info_cache():
+    _module_info_cache.clear()
+    _module_path_cache.clear()
+    _module_cache_refs.clear()
+
+
 def extract_module_path(raw_cls_or_fn: Union[Type, Callable]):
+    obj_id = id(raw_cls_or_fn)
+    if obj_id in _module_path_cache:
+        return _module_path_cache[obj_id]
+
     py_module = inspect.getmodule(raw_cls_or_fn)
 
     # Need to resolve in case just filename is given
@@ -289,6 +334,7 @@ def extract_module_path(raw_cls_or_fn: Union[Type, Callable]):
         else None
     )
 
+    _store_in_module_cache(_module_path_cache, raw_cls_or_fn, module_path)
     return module_path
 
 
@@ -296,6 +342,9 @@ def get_module_import_info(raw_cls_or_fn: Union[Type, Callable]):
     """
     Given a class or function in Python, get all the information needed to import it in another Python process.
     """
+    obj_id = id(raw_cls_or_fn)
+    if obj_id in _module_info_cache:
+        return _module_info_cache[obj_id]
 
     # Background on all these dunders: https://docs.python.org/3/reference/import.html
     py_module = inspect.getmodule(raw_cls_or_fn)
@@ -339,6 +388,9 @@ def get_module_import_info(raw_cls_or_fn: Union[Type, Callable]):
             root_path = os.path.dirname(base_dirs[0])
             module_name = py_module.__spec__.name
 
+    _store_in_module_cache(
+        _module_info_cache, raw_cls_or_fn, (root_path, module_name, cls_or_fn_name)
+    )
     return root_path, module_name, cls_or_fn_name
 
 
@@ -387,21 +439,69 @@ def thread_coroutine(coroutine, context=None):
         loop.close()
 
 
-# We should minimize calls to this since each one will start a new thread.
-# Technically we should not have many threads running async logic at once, however, the calling thread
-# will actually block until the async logic that is spawned in the other thread is done.
+# A single long-lived event loop running in a daemon thread, used to service all sync->async
+# boundaries (e.g. the various sync wrappers in obj_store). Spinning up a fresh thread and event
+# loop per call is surprisingly expensive, and these wrappers sit on hot paths like
+# `ClusterServlet.status`.
+_background_loop: Optional[asyncio.AbstractEventLoop] = None
+_background_loop_thread: Optional[threading.Thread] = None
+_background_loop_lock = threading.Lock()
+
+# A single long-lived thread pool shared by `arun_in_thread` calls, so repeated calls don't
+# reallocate a pool (and its threads) each time.
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    global _background_loop, _background_loop_thread
+    if _background_loop is None:
+        with _background_loop_lock:
+            if _background_loop is None:
+                loop = asyncio.new_event_loop()
+                _background_loop_thread = threading.Thread(
+                    target=loop.run_forever, daemon=True
+                )
+                _background_loop_thread.start()
+                _background_loop = loop
+    return _background_loop
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor()
+    return _executor
+
+
+# The calling thread will block until the async logic that is dispatched to the background loop
+# is done, so this behaves exactly like running the coroutine in a temporary thread, minus the
+# per-call thread and event loop construction.
 def sync_function(coroutine_func):
     @functools.wraps(coroutine_func)
     def wrapper(*args, **kwargs):
-        # Better API than using threading.Thread, since we just need the thread temporarily
-        # and the resources are cleaned up
-        with ThreadPoolExecutor() as executor:
-            future = executor.submit(
-                thread_coroutine,
-                coroutine_func(*args, **kwargs),
-                contextvars.copy_context(),
-            )
-            return future.result()
+        context = contextvars.copy_context()
+
+        async def _run_with_context():
+            # Copy contextvars from the calling thread into the background loop's task
+            for var, value in context.items():
+                var.set(value)
+            return await coroutine_func(*args, **kwargs)
+
+        if threading.current_thread() is _background_loop_thread:
+            # We're already inside the background loop (e.g. a coroutine calling back into a sync
+            # wrapper), so dispatching to it would deadlock. Fall back to a temporary thread.
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                return executor.submit(
+                    thread_coroutine, coroutine_func(*args, **kwargs), context
+                ).result()
+
+        future = asyncio.run_coroutine_threadsafe(
+            _run_with_context(), _get_background_loop()
+        )
+        return future.result()
 
     return wrapper
 
@@ -413,17 +513,16 @@ async def arun_in_thread(method_to_run, *args, **kwargs):
 
         return sync_fn(*method_args, **method_kwargs)
 
-    with ThreadPoolExecutor() as executor:
-        return await asyncio.get_event_loop().run_in_executor(
-            executor,
-            functools.partial(
-                _run_sync_fn_with_context,
-                context_to_set=contextvars.copy_context(),
-                sync_fn=method_to_run,
-                method_args=args,
-                method_kwargs=kwargs,
-            ),
-        )
+    return await asyncio.get_event_loop().run_in_executor(
+        _get_executor(),
+        functools.partial(
+            _run_sync_fn_with_context,
+            context_to_set=contextvars.copy_context(),
+            sync_fn=method_to_run,
+            method_args=args,
+            method_kwargs=kwargs,
+        ),
+    )
 
 
 ####################################################################################################
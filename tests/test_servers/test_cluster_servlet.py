@@ -0,0 +1,109 @@
+import asyncio
+import time
+
+import pytest
+
+from runhouse.servers.cluster_servlet import (
+    _TTLCache,
+    ClusterServlet,
+    ClusterServletError,
+)
+
+
+@pytest.mark.servertest
+class TestTTLCache:
+    @pytest.mark.level("unit")
+    def test_entries_expire_after_ttl(self):
+        cache = _TTLCache(maxsize=10, ttl=0.05)
+        cache.set("token", "verdict")
+        assert cache.get("token") == "verdict"
+
+        time.sleep(0.06)
+        assert cache.get("token") is None
+        assert cache.get("token", default=False) is False
+
+    @pytest.mark.level("unit")
+    def test_oldest_entries_evicted_at_maxsize(self):
+        cache = _TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("c", 3)
+
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+        assert cache.get("c") == 3
+
+        # Overwriting an existing key doesn't evict anything
+        cache.set("b", 20)
+        assert cache.get("b") == 20
+        assert cache.get("c") == 3
+
+    @pytest.mark.level("unit")
+    def test_pop_and_clear(self):
+        cache = _TTLCache(maxsize=10, ttl=60)
+        cache.set("a", 1)
+        assert cache.pop("a") == 1
+        assert cache.get("a") is None
+        assert cache.pop("missing", default="fallback") == "fallback"
+
+        cache.set("b", 2)
+        cache.clear()
+        assert cache.get("b") is None
+
+
+def _batcher_servlet(apply_updates):
+    """Build a bare ClusterServlet wired up just enough to run the config update batcher,
+    with the servlet fan-out replaced by ``apply_updates``."""
+    servlet = ClusterServlet.__new__(ClusterServlet)
+    servlet.cluster_config = {}
+    servlet._main_loop = asyncio.get_running_loop()
+    servlet._config_update_queue = asyncio.Queue()
+    servlet._apply_cluster_config_updates = apply_updates
+    servlet._config_update_task = asyncio.create_task(servlet._config_update_loop())
+    return servlet
+
+
+@pytest.mark.servertest
+class TestConfigUpdateBatcher:
+    @pytest.mark.level("unit")
+    @pytest.mark.asyncio
+    async def test_concurrent_writes_coalesce_into_one_batch(self):
+        applied_batches = []
+
+        async def apply_updates(updates):
+            applied_batches.append(dict(updates))
+            servlet.cluster_config.update(updates)
+
+        servlet = _batcher_servlet(apply_updates)
+        try:
+            results = await asyncio.gather(
+                servlet.aset_cluster_config_value("autostop_mins", 10),
+                servlet.aset_cluster_config_value("den_auth", True),
+                servlet.aset_cluster_config_value("autostop_mins", 30),
+            )
+        finally:
+            servlet._config_update_task.cancel()
+
+        # All three writes landed in a single merged fan-out, last write winning per key
+        assert applied_batches == [{"autostop_mins": 30, "den_auth": True}]
+        for result in results:
+            assert result == servlet.cluster_config
+
+    @pytest.mark.level("unit")
+    @pytest.mark.asyncio
+    async def test_apply_failure_propagates_to_all_waiters(self):
+        async def apply_updates(updates):
+            if "bad_key" in updates:
+                raise ClusterServletError("fan-out failed")
+            servlet.cluster_config.update(updates)
+
+        servlet = _batcher_servlet(apply_updates)
+        try:
+            with pytest.raises(ClusterServletError):
+                await servlet.aset_cluster_config_value("bad_key", 1)
+
+            # The batcher keeps draining after a failed batch
+            result = await servlet.aset_cluster_config_value("good_key", 2)
+            assert result["good_key"] == 2
+        finally:
+            servlet._config_update_task.cancel()
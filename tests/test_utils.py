@@ -0,0 +1,77 @@
+import gc
+
+import pytest
+
+from runhouse.utils import (
+    _module_info_cache,
+    _module_path_cache,
+    _store_in_module_cache,
+    clear_module_info_cache,
+    extract_module_path,
+    get_module_import_info,
+)
+
+
+@pytest.mark.level("unit")
+def test_module_import_info_is_memoized():
+    clear_module_info_cache()
+
+    def sample_fn():
+        return 1
+
+    root_path, module_name, fn_name = get_module_import_info(sample_fn)
+    assert fn_name.endswith("sample_fn")
+    assert id(sample_fn) in _module_info_cache
+
+    # Repeat calls are served from the cache
+    assert get_module_import_info(sample_fn) == (root_path, module_name, fn_name)
+    assert get_module_import_info(sample_fn) is _module_info_cache[id(sample_fn)]
+
+    module_path = extract_module_path(sample_fn)
+    assert module_path.endswith("test_utils.py")
+    assert id(sample_fn) in _module_path_cache
+    assert extract_module_path(sample_fn) == module_path
+
+
+@pytest.mark.level("unit")
+def test_module_info_cache_evicted_when_object_collected():
+    clear_module_info_cache()
+
+    def sample_fn():
+        return 1
+
+    obj_id = id(sample_fn)
+    get_module_import_info(sample_fn)
+    extract_module_path(sample_fn)
+    assert obj_id in _module_info_cache
+    assert obj_id in _module_path_cache
+
+    # Collecting the function must evict its entries, so a reused id can't serve stale info
+    del sample_fn
+    gc.collect()
+    assert obj_id not in _module_info_cache
+    assert obj_id not in _module_path_cache
+
+
+@pytest.mark.level("unit")
+def test_clear_module_info_cache():
+    def sample_fn():
+        return 1
+
+    get_module_import_info(sample_fn)
+    assert _module_info_cache
+
+    clear_module_info_cache()
+    assert not _module_info_cache
+    assert not _module_path_cache
+
+
+@pytest.mark.level("unit")
+def test_module_cache_skips_non_weakrefable_objects():
+    clear_module_info_cache()
+
+    # Objects that can't be weakref'd can't have their lifetime tracked, so they must not
+    # be cached at all (a reused id could otherwise serve stale info)
+    obj = (1, 2)
+    _store_in_module_cache(_module_path_cache, obj, "some/path")
+    assert id(obj) not in _module_path_cache